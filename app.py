@@ -8,7 +8,8 @@ Usage:
 
 Required parameters:
 
-xml_filename: - name of the source time-sheet file to query,
+xml_filename: - name of the source time-sheet file to query, `-` to
+                read the time-sheet data from stdin,
 
 Optional parameters:
 
@@ -47,7 +48,8 @@ def _parse_arguments():
     description = 'Clock-In-Clock-Out: time-sheet analysis'
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument('xml_filename', type=str,
-                        help='source time-sheet file (.XML)')
+                        help='source time-sheet file (.XML), '
+                             '"-" to read from stdin')
     parser.add_argument('-s', '--start', type=_validate_arg_date,
                         help='starting date filter in DD-MM-YYYY format')
     parser.add_argument('-e', '--end', type=_validate_arg_date,
@@ -68,7 +70,11 @@ def main():
     args = _parse_arguments()
     # Run the analysis
     try:
-        results = cc.query(**args)
+        if args['xml_filename'] == '-':
+            del args['xml_filename']
+            results = cc.query_stream(sys.stdin.buffer, **args)
+        else:
+            results = cc.query(**args)
     # Gracefully process fatal errors
     except FileNotFoundError:
         print(f'Error. File {args["xml_filename"]} not found.')
@@ -11,6 +11,8 @@ It can:
 - Aggregate data by date and (optionally) person,
 - Report the results as a pandas DataFrame.
 - Generate random sample data in time-sheet format
+- Read time sheet data incrementally from streams (stdin, pipes,
+  sockets, asyncio readers)
 
 Usage:
 
@@ -31,7 +33,17 @@ Generating random sample data (50 time-sheet records):
 
 >>> cc.write_file('sample.xml', 50)
 
+Querying a binary stream (e.g. stdin) instead of a file:
+
+>>> cc.query_stream(sys.stdin.buffer, names=True)
+
+Updating aggregates as the data arrives from an asyncio stream:
+
+>>> async for results in cc.aiter_stream(reader):
+...     print(results)
+
 """
 
 from .clock_in_clock_out import query
-from .generate_sample_data import write_sample_file
\ No newline at end of file
+from .generate_sample_data import write_sample_file
+from .stream import TimesheetFeed, query_stream, aiter_stream, aquery_stream
\ No newline at end of file
@@ -121,6 +121,18 @@ def _aggregate_data(dataset: pd.DataFrame, include_names: bool) -> pd.DataFrame:
     else:
         return to_agg[['date', 'time']].groupby('date').sum().reset_index()
 
+def _update_results(results: pd.DataFrame, batch: list, start: str,
+                    end: str, names: bool) -> pd.DataFrame:
+    """Augment and filter a batch of extracted records, append it to the
+    results dataset and re-aggregate the results."""
+    if not batch:
+        return results
+    data_df = pd.DataFrame(batch)
+    augm_data = _add_derivative_data(data_df)
+    filtered_data = _filter_data(augm_data, start, end)
+    results = results.append(filtered_data)
+    return _aggregate_data(results, names)
+
 def query(xml_filename: str, start: str = '01-01-1970', 
           end: str = '31-12-2199', names: bool = False) -> pd.DataFrame:
     """
@@ -145,10 +157,6 @@ def query(xml_filename: str, start: str = '01-01-1970',
     # Run 'on-the-fly' processing batch-by-batch
     batch_size = 1000
     for batch in _get_batch(xml_filename, batch_size):
-        data_df = pd.DataFrame(batch)
-        augm_data = _add_derivative_data(data_df)
-        filtered_data = _filter_data(augm_data, start, end)
-        results = results.append(filtered_data)
-        results = _aggregate_data(results, names)
+        results = _update_results(results, batch, start, end, names)
     # Export
     return results
\ No newline at end of file
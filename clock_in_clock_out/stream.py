@@ -0,0 +1,212 @@
+"""
+stream
+------
+
+Incremental ingestion of time-sheet data from non-file sources (sockets,
+pipes, stdin, asyncio streams).
+
+Instead of parsing a file by name, the data is fed to an
+`etree.XMLPullParser` chunk by chunk and the aggregates are updated as
+soon as complete `person` records arrive. Schema validation, filtering
+and aggregation are the same as in `query()`.
+
+API:
+
+`TimesheetFeed(start: str, end: str, names: bool)` - a push-style feed:
+call `feed(chunk)` with bytes as they arrive, `close()` at the end of
+the stream and read the aggregates from `results` (and the number of
+records read so far from `records`).
+
+`query_stream(stream, start: str, end: str, names: bool)` - query a
+binary file-like object (e.g. `sys.stdin.buffer`, `socket.makefile('rb')`).
+
+`aiter_stream(stream, start: str, end: str, names: bool)` - an async
+generator yielding updated aggregates as the data arrives from an
+`asyncio.StreamReader` or any async iterable of bytes chunks. Sync
+streams such as `sys.stdin.buffer` must be queried with `query_stream`.
+
+`aquery_stream(stream, start: str, end: str, names: bool)` - a coroutine
+returning the final aggregates of an async stream. Several streams can
+be processed concurrently with `asyncio.gather`.
+"""
+
+import copy
+import inspect
+from lxml import etree
+import pandas as pd
+
+from .clock_in_clock_out import (_schema, _extract_data_from_element,
+                                 _clear_element, _update_results)
+
+
+def _check_root(element: etree.Element):
+    """Check that the document root is a `people` element, so that a
+    wrong document fails before any record is read."""
+    if element.tag != 'people':
+        raise etree.XMLSyntaxError(f"Unexpected root element "
+                                   f"'{element.tag}', expected 'people'",
+                                   0, element.sourceline, 0)
+
+def _check_record(schema: etree.XMLSchema, element: etree.Element):
+    """Validate a completed record against the time-sheet schema.
+
+    The record is validated within a copy of its root (attributes and
+    the text preceding the record) to check everything the schema
+    defines for the document read so far. Raise etree.XMLSyntaxError,
+    as the parser does for the rest of the document, if it's invalid.
+    """
+    parent = element.getparent()
+    shell = etree.Element(parent.tag, parent.attrib)
+    shell.text = parent.text
+    previous = element.getprevious()
+    if previous is not None and previous.tail:
+        shell.text = (shell.text or '') + previous.tail
+    record = copy.deepcopy(element)
+    record.tail = None
+    shell.append(record)
+    try:
+        schema.assertValid(shell)
+    except etree.DocumentInvalid as e:
+        raise etree.XMLSyntaxError(str(e), 0, element.sourceline, 0) from e
+
+
+class TimesheetFeed:
+    """Incremental time-sheet query fed with bytes chunks.
+
+    Memory usage doesn't depend on the stream size: parsed `person`
+    elements are cleared right after their data has been extracted and
+    extracted records are merged into the aggregates in batches of
+    `batch_size`.
+
+    An XML pull parser validates against the schema only on close, so
+    every completed record is validated against the schema before it is
+    aggregated: invalid records never get into `results`.
+    """
+
+    def __init__(self, start: str = '01-01-1970', end: str = '31-12-2199',
+                 names: bool = False, batch_size: int = 1000):
+        self.start = start if start else '01-01-1970'
+        self.end = end if end else '31-12-2199'
+        self.names = names if names else False
+        self.batch_size = batch_size
+        self.results = pd.DataFrame()
+        self.records = 0
+        self._schema = _schema()
+        self._parser = etree.XMLPullParser(events=('start', 'end'),
+                                           schema=self._schema)
+
+    def _read_events(self) -> int:
+        """Check and extract records from the parsed `person` elements
+        and merge them into the results. Return the number of records
+        read."""
+        batch = []
+        counter = 0
+        for event, element in self._parser.read_events():
+            parent = element.getparent()
+            if event == 'start':
+                if parent is None:
+                    _check_root(element)
+                continue
+            # Only the completed children of the root are records
+            if parent is None or parent.getparent() is not None:
+                continue
+            _check_record(self._schema, element)
+            batch.append(_extract_data_from_element(element))
+            _clear_element(element)
+            counter += 1
+            if len(batch) >= self.batch_size:
+                self._merge(batch)
+                batch = []
+        self._merge(batch)
+        self.records += counter
+        return counter
+
+    def _merge(self, batch: list):
+        """Merge a batch of extracted records into the results."""
+        self.results = _update_results(self.results, batch, self.start,
+                                       self.end, self.names)
+
+    def feed(self, chunk: bytes) -> int:
+        """Feed a chunk of XML data and update the aggregates. Return
+        the number of records completed by this chunk.
+
+        Raises etree.XMLSyntaxError if the data is not valid XML or a
+        record doesn't match the time-sheet schema.
+        """
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> pd.DataFrame:
+        """Finish parsing at the end of the stream and return the
+        aggregates.
+
+        Raises etree.XMLSyntaxError if the document is incomplete or
+        schema validation fails.
+        """
+        self._parser.close()
+        self._read_events()
+        return self.results
+
+
+def query_stream(stream, start: str = '01-01-1970', end: str = '31-12-2199',
+                 names: bool = False, chunk_size: int = 65536) -> pd.DataFrame:
+    """Read time-sheet data from a binary file-like object, filter it
+    and aggregate it on-the-fly. See `query()` for the arguments."""
+    feed = TimesheetFeed(start, end, names)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        feed.feed(chunk)
+    return feed.close()
+
+async def _achunks(stream, chunk_size: int):
+    """Iterate over bytes chunks of an asyncio.StreamReader (or any
+    object with an awaitable `read` method) or an async iterable.
+
+    Raises TypeError for sync streams (e.g. `sys.stdin.buffer`), which
+    must be queried with `query_stream`.
+    """
+    if hasattr(stream, 'read'):
+        while True:
+            chunk = stream.read(chunk_size)
+            if not inspect.isawaitable(chunk):
+                raise TypeError(f'{type(stream).__name__}.read() is not '
+                                'awaitable, use query_stream() to query '
+                                'sync streams.')
+            chunk = await chunk
+            if not chunk:
+                break
+            yield chunk
+    else:
+        async for chunk in stream:
+            yield chunk
+
+async def aiter_stream(stream, start: str = '01-01-1970',
+                       end: str = '31-12-2199', names: bool = False,
+                       chunk_size: int = 65536):
+    """Read time-sheet data from an async stream and yield the updated
+    aggregates (a pandas DataFrame) every time new records arrive.
+
+    >>> async for results in aiter_stream(reader, names=True):
+    ...     print(results)
+    """
+    feed = TimesheetFeed(start, end, names)
+    async for chunk in _achunks(stream, chunk_size):
+        if feed.feed(chunk):
+            yield feed.results
+    # Records completed only at the end of the stream (if any)
+    records = feed.records
+    feed.close()
+    if feed.records > records:
+        yield feed.results
+
+async def aquery_stream(stream, start: str = '01-01-1970',
+                        end: str = '31-12-2199', names: bool = False,
+                        chunk_size: int = 65536) -> pd.DataFrame:
+    """Read time-sheet data from an async stream and return the final
+    aggregates."""
+    feed = TimesheetFeed(start, end, names)
+    async for chunk in _achunks(stream, chunk_size):
+        feed.feed(chunk)
+    return feed.close()
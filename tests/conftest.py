@@ -20,13 +20,13 @@ def sample_xml_element():
 def sample_source_df():
     """A fixture to emulate a source data parsed dataframe."""
     data = [{'full_name':'a.bc', 'start':'02-01-2000 10:00:00', 
-             'end':'02-01-2000 19:00:00'},
+            'end':'02-01-2000 19:00:00'},
             {'full_name':'d.ef', 'start':'12-09-2000 10:00:00', 
-             'end':'12-09-2000 19:00:00'},
+            'end':'12-09-2000 19:00:00'},
             {'full_name':'g.hi', 'start':'30-07-2009 10:00:00', 
-             'end':'30-07-2009 19:00:00'},
+            'end':'30-07-2009 19:00:00'},
             {'full_name':'j.kl', 'start':'02-01-2000 10:00:00', 
-             'end':'02-01-2000 19:00:00'}]
+            'end':'02-01-2000 19:00:00'}]
     data_df = pd.DataFrame(data)
     return data_df
 
@@ -35,12 +35,44 @@ def sample_derivate_df():
     """A fixture to emulate a dataframe with derivative fields in 
     place."""
     data = [{'full_name':'a.bc', 'start':'02-01-2000 10:00:00', 
-             'end':'02-01-2000 19:00:00', 'date':'02-01-2000', 'time':9},
+            'end':'02-01-2000 19:00:00', 'date':'02-01-2000', 'time':9},
             {'full_name':'a.bc', 'start':'12-09-2000 10:00:00', 
-             'end':'12-09-2000 19:00:00', 'date':'12-09-2000', 'time':9},
+            'end':'12-09-2000 19:00:00', 'date':'12-09-2000', 'time':9},
             {'full_name':'g.hi', 'start':'30-07-2009 10:00:00', 
-             'end':'30-07-2009 19:00:00', 'date':'30-07-2009', 'time':9},
+            'end':'30-07-2009 19:00:00', 'date':'30-07-2009', 'time':9},
             {'full_name':'j.kl', 'start':'02-01-2000 10:00:00', 
-             'end':'02-01-2000 19:00:00', 'date':'02-01-2000', 'time':9}]
+            'end':'02-01-2000 19:00:00', 'date':'02-01-2000', 'time':9}]
     data_df = pd.DataFrame(data)
-    return data_df
\ No newline at end of file
+    return data_df
+
+@pytest.fixture
+def xml_content():
+    """A small time-sheet document that covers basic scenarios."""
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<people>'
+            '  <person full_name="h.simpson">'
+            '    <start>01-01-2020 10:00:00</start>'
+            '    <end>01-01-2020 19:00:00</end>'
+            '  </person>'
+            '  <person full_name="d.vader">'
+            '    <start>01-01-2020 11:00:00</start>'
+            '    <end>01-01-2020 17:00:00</end>'
+            '  </person>'
+            '  <person full_name="h.simpson">'
+            '    <start>02-01-2020 10:00:00</start>'
+            '    <end>02-01-2020 18:00:00</end>'
+            '  </person>'
+            '  <person full_name="h.simpson">'
+            '    <start>03-01-2020 10:00:00</start>'
+            '    <end>03-01-2020 19:00:00</end>'
+            '  </person>'
+            '  <person full_name="h.simpson">'
+            '    <start>04-01-2020 20:00:00</start>'
+            '    <end>05-01-2020 02:00:00</end>'
+            '  </person>'
+            '</people>')
+
+@pytest.fixture
+def xml_bytes(xml_content):
+    """The `xml_content` time-sheet document as bytes."""
+    return xml_content.encode()
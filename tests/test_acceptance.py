@@ -7,39 +7,18 @@ Tests that demonstarte the usage of the clock_in_clock_out module for
 the most important use-cases.
 """
 
+import io
 import os
 import pandas as pd
 import pytest
 
+import app
 import clock_in_clock_out as cc
 
 @pytest.fixture
-def mock_xml():
+def mock_xml(xml_content):
     """Create a small test XML that covers basic scenarios."""
     filename = './mock_data.xml'
-    xml_content = ('<?xml version="1.0" encoding="UTF-8"?>'
-                   '<people>'
-                   '  <person full_name="h.simpson">'
-                   '    <start>01-01-2020 10:00:00</start>'
-                   '    <end>01-01-2020 19:00:00</end>'
-                   '  </person>'
-                   '  <person full_name="d.vader">'
-                   '    <start>01-01-2020 11:00:00</start>'
-                   '    <end>01-01-2020 17:00:00</end>'
-                   '  </person>'
-                   '  <person full_name="h.simpson">'
-                   '    <start>02-01-2020 10:00:00</start>'
-                   '    <end>02-01-2020 18:00:00</end>'
-                   '  </person>'
-                   '  <person full_name="h.simpson">'
-                   '    <start>03-01-2020 10:00:00</start>'
-                   '    <end>03-01-2020 19:00:00</end>'
-                   '  </person>'
-                   '  <person full_name="h.simpson">'
-                   '    <start>04-01-2020 20:00:00</start>'
-                   '    <end>05-01-2020 02:00:00</end>'
-                   '  </person>'
-                   '</people>')
     with open(filename, 'w') as f:
         f.write(xml_content)
     yield filename
@@ -91,4 +70,15 @@ def test_scenario_5(mock_xml):
         {'date':'01-01-2020', 'full_name':'d.vader', 'time':6.0},
         {'date':'01-01-2020', 'full_name':'h.simpson', 'time':9.0}],
         index=[0, 1])
-    pd.testing.assert_frame_equal(results, expected)
\ No newline at end of file
+    pd.testing.assert_frame_equal(results, expected)
+
+def test_scenario_stdin(xml_bytes, monkeypatch, capsys):
+    """Testing the CLI reading time-sheet data from stdin - working time
+    by date, `-` passed as the source file name."""
+    stdin = io.TextIOWrapper(io.BytesIO(xml_bytes))
+    monkeypatch.setattr('sys.stdin', stdin)
+    monkeypatch.setattr('sys.argv', ['app.py', '-', '-e01-01-2020'])
+    app.main()
+    output = capsys.readouterr().out
+    assert '01-01-2020  15.0' in output
+    assert '02-01-2020' not in output
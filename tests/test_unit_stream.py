@@ -0,0 +1,148 @@
+"""
+A test suite to cover stream module with unit tests.
+"""
+
+import asyncio
+import io
+from lxml import etree
+import pandas as pd
+import pytest
+
+import clock_in_clock_out.stream as st
+
+
+@pytest.fixture
+def expected():
+    """Aggregates by date expected for `xml_bytes`."""
+    return pd.DataFrame([{'date':'01-01-2020', 'time':15.0},
+                         {'date':'02-01-2020', 'time':8.0},
+                         {'date':'03-01-2020', 'time':9.0},
+                         {'date':'04-01-2020', 'time':6.0}],
+                        index=[0, 1, 2, 3])
+
+
+async def _chunks(data: bytes, size: int):
+    """Emulate an async source yielding bytes chunks."""
+    for i in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[i:i + size]
+
+
+def test_feed_updates_results(xml_bytes):
+    """Test that aggregates are updated as soon as a record arrives."""
+    feed = st.TimesheetFeed()
+    split = xml_bytes.index(b'<person full_name="d.vader">')
+    assert feed.feed(xml_bytes[:split]) == 1
+    assert list(feed.results['time']) == [9.0]
+    assert feed.feed(xml_bytes[split:]) == 4
+    assert list(feed.results['time']) == [15.0, 8.0, 9.0, 6.0]
+
+def test_feed_filter_names(xml_bytes):
+    """Test filtering and break down by person on a feed."""
+    feed = st.TimesheetFeed(start='01-01-2020', end='01-01-2020', names=True)
+    feed.feed(xml_bytes)
+    results = feed.close()
+    assert list(results['full_name']) == ['d.vader', 'h.simpson']
+
+def test_feed_small_batches(xml_bytes, expected):
+    """Test that merging records in small batches gives the same
+    results."""
+    feed = st.TimesheetFeed(batch_size=1)
+    feed.feed(xml_bytes)
+    pd.testing.assert_frame_equal(feed.close(), expected)
+
+def test_feed_invalid_schema():
+    """Test that schema validation errors of an incomplete document are
+    raised on close."""
+    feed = st.TimesheetFeed()
+    feed.feed(b'<people><person full_name="a.bc">')
+    with pytest.raises(etree.XMLSyntaxError):
+        feed.close()
+
+@pytest.mark.parametrize('record', [
+    b'<person><start>01-01-2020 10:00:00</start>'
+    b'<end>01-01-2020 19:00:00</end></person>',
+    b'<person full_name="a.bc"><foo>01-01-2020 10:00:00</foo>'
+    b'<bar>01-01-2020 19:00:00</bar></person>',
+    b'<person full_name="a.bc"><end>01-01-2020 19:00:00</end>'
+    b'<start>01-01-2020 10:00:00</start></person>',
+    b'<person full_name="a.bc"><start>01-01-2020 10:00:00</start></person>',
+    b'<persn full_name="a.bc"><start>01-01-2020 10:00:00</start>'
+    b'<end>01-01-2020 19:00:00</end></persn>',
+    b'<person full_name="a.bc" foo="x"><start>01-01-2020 10:00:00</start>'
+    b'<end>01-01-2020 19:00:00</end></person>',
+    b'<person full_name="a.bc">junk<start>01-01-2020 10:00:00</start>'
+    b'<end>01-01-2020 19:00:00</end></person>',
+    b'<person full_name="a.bc"><start x="1">01-01-2020 10:00:00</start>'
+    b'<end>01-01-2020 19:00:00</end></person>',
+    b'<person full_name="a.bc"><start>01-01-2020 10:00:00</start>'
+    b'<end x="1">01-01-2020 19:00:00</end></person>'])
+def test_feed_invalid_record(record):
+    """Test that a record failing the schema raises on feed and doesn't
+    get into the results."""
+    feed = st.TimesheetFeed()
+    with pytest.raises(etree.XMLSyntaxError):
+        feed.feed(b'<people>' + record)
+    assert feed.results.empty
+    assert feed.records == 0
+
+@pytest.mark.parametrize('root', [b'<nope>', b'<people foo="x">',
+                                  b'<people>junk'])
+def test_feed_invalid_root(root):
+    """Test that a document with an invalid root element raises on feed
+    and its records don't get into the results."""
+    feed = st.TimesheetFeed()
+    with pytest.raises(etree.XMLSyntaxError):
+        feed.feed(root + b'<person full_name="a.bc">'
+                  b'<start>01-01-2020 10:00:00</start>'
+                  b'<end>01-01-2020 19:00:00</end></person>')
+    assert feed.results.empty
+    assert feed.records == 0
+
+def test_query_stream(xml_bytes, expected):
+    """Test querying a binary file-like object chunk by chunk."""
+    results = st.query_stream(io.BytesIO(xml_bytes), chunk_size=7)
+    pd.testing.assert_frame_equal(results, expected)
+
+def test_aiter_stream(xml_bytes, expected):
+    """Test that an async stream yields updated aggregates."""
+    async def collect():
+        return [r async for r in st.aiter_stream(_chunks(xml_bytes, 50))]
+    updates = asyncio.run(collect())
+    assert len(updates) > 1
+    pd.testing.assert_frame_equal(updates[-1], expected)
+
+def test_aiter_stream_invalid(xml_bytes):
+    """Test that an invalid document yields no aggregates."""
+    updates = []
+    async def collect():
+        invalid = xml_bytes.replace(b'full_name="h.simpson"',
+                                    b'full_name="h.simpson" foo="x"', 1)
+        async for results in st.aiter_stream(_chunks(invalid, 50)):
+            updates.append(results)
+    with pytest.raises(etree.XMLSyntaxError):
+        asyncio.run(collect())
+    assert updates == []
+
+def test_aquery_stream_sync_stream(xml_bytes):
+    """Test that a sync stream is rejected in favour of query_stream."""
+    with pytest.raises(TypeError, match='query_stream'):
+        asyncio.run(st.aquery_stream(io.BytesIO(xml_bytes)))
+
+def test_aquery_stream_reader(xml_bytes, expected):
+    """Test querying an asyncio.StreamReader."""
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(xml_bytes)
+        reader.feed_eof()
+        return await st.aquery_stream(reader, chunk_size=16)
+    pd.testing.assert_frame_equal(asyncio.run(run()), expected)
+
+def test_aquery_stream_concurrent(xml_bytes, expected):
+    """Test processing several streams concurrently in one loop."""
+    async def run():
+        return await asyncio.gather(
+            st.aquery_stream(_chunks(xml_bytes, 10)),
+            st.aquery_stream(_chunks(xml_bytes, 33)))
+    for results in asyncio.run(run()):
+        pd.testing.assert_frame_equal(results, expected)